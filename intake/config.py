@@ -13,17 +13,21 @@ import copy
 import logging
 import os
 import posixpath
+import re
+from functools import lru_cache
 from os.path import expanduser
 
 import yaml
 from fsspec.implementations.local import make_path_posix
 
-from intake.utils import yaml_load
+from intake.utils import Dumper, yaml_load
 
 logger = logging.getLogger("intake")
 
 confdir = make_path_posix(os.getenv("INTAKE_CONF_DIR", os.path.join(expanduser("~"), ".intake")))
 
+_PATH_SPLIT_RE = re.compile(";" if os.name == "nt" else r"(?<!:):(?![:/])")
+
 
 defaults = {
     "logging": "INFO",
@@ -38,8 +42,14 @@ defaults = {
 }
 
 
+@lru_cache(None)
+def _default_cfile(confdir):
+    return make_path_posix(posixpath.join(confdir, "conf.yaml"))
+
+
 def cfile():
-    return make_path_posix(os.getenv("INTAKE_CONF_FILE", posixpath.join(confdir, "conf.yaml")))
+    env = os.getenv("INTAKE_CONF_FILE")
+    return make_path_posix(env) if env else _default_cfile(confdir)
 
 
 class Config(dict):
@@ -73,8 +83,8 @@ class Config(dict):
             os.makedirs(os.path.dirname(fn))
         except (OSError, IOError):
             pass
-        with open(fn, "w") as f:
-            yaml.dump(dict(self), f)
+        with open(fn, "wb") as f:
+            yaml.dump(dict(self), f, Dumper=Dumper, encoding="utf-8")
 
     @contextlib.contextmanager
     def _unset(self, temp):
@@ -106,7 +116,8 @@ class Config(dict):
 
         >>> intake.conf.set(intake.readers.utils.nested_keys_to_dict({"deep.2.key": True})
         """
-        temp = copy.deepcopy(self)
+        # merge_dicts builds new containers rather than mutating, so one level is enough
+        temp = {k: copy.copy(v) if isinstance(v, (dict, list)) else v for k, v in self.items()}
         if update_dict:
             kw.update(update_dict)
         from intake.readers.utils import merge_dicts
@@ -143,7 +154,7 @@ class Config(dict):
         fn = fn or self.filename
 
         if os.path.isfile(fn):
-            with open(fn) as f:
+            with open(fn, "rb") as f:
                 try:
                     self.update(yaml_load(f))
                 except Exception as e:
@@ -171,13 +182,9 @@ def intake_path_dirs(path):
     """
     if isinstance(path, (list, tuple)):
         return path
-    import re
-
-    pattern = re.compile(";" if os.name == "nt" else r"(?<!:):(?![:/])")
-    return pattern.split(path)
+    return _PATH_SPLIT_RE.split(path)
 
 
 conf = Config()
-conf.reload_all()
 save_conf = conf.save
 load_cond = conf.load
@@ -16,8 +16,10 @@ from intake.readers.utils import LazyDict
 class TiledLazyEntries(LazyDict):
     """A dictionary-like, which only loads a key's value from Tiled on demand"""
 
-    def __init__(self, client):
+    def __init__(self, client, keys: list[str] | None = None):
         self.client = client
+        # listing a Tiled node is a remote call, so reuse a listing if we already have one
+        self._keys = keys
 
     def __getitem__(self, item: str) -> ReaderDescription:
         from intake.readers.readers import TiledClient
@@ -34,13 +36,20 @@ class TiledLazyEntries(LazyDict):
         return reader.to_entry()
 
     def __len__(self):
+        if self._keys is not None:
+            return len(self._keys)
         return len(self.client)
 
     def __iter__(self):
+        if self._keys is not None:
+            return iter(self._keys)
         return iter(self.client)
 
     def __repr__(self):
-        return f"TiledEntries {sorted(set(self))}"
+        # avoid listing the whole of a potentially large remote node
+        keys = list(itertools.islice(iter(self), 20))
+        more = "..." if len(self) > 20 else ""
+        return f"TiledEntries {sorted(keys)}{more}"
 
 
 class TiledCatalogReader(BaseReader):
@@ -60,10 +69,11 @@ class TiledCatalogReader(BaseReader):
         opts = data.options.copy()
         opts.update(kwargs)
         client = from_uri(data.url, **opts)
-        entries = TiledLazyEntries(client)
+        keys = list(client)
+        entries = TiledLazyEntries(client, keys=keys)
         return Catalog(
             entries=entries,
-            aliases={k: k for k in sorted(client)},
+            aliases=dict(zip(keys, keys)),
             metadata=client.item,
         )
 
@@ -85,13 +95,13 @@ class SQLAlchemyCatalog(BaseReader):
         engine = sqlalchemy.create_engine(data.url)
         meta = sqlalchemy.MetaData()
         meta.reflect(bind=engine, views=views, schema=schema)
-        tables = list(meta.tables)
+        conn = data.url
         entries = {
             name: DataDescription(
                 "intake.readers.datatypes:SQLQuery",
-                kwargs={"conn": data.url, "query": name},
+                kwargs={"conn": conn, "query": name},
             )
-            for name in tables
+            for name in meta.tables
         }
         return Catalog(data=entries)
 
@@ -143,14 +153,14 @@ class StacCatalogReader(BaseReader):
         metadata.pop("links", None)
         self.metadata.update(metadata)
         cat = Catalog(metadata=self.metadata)
-        items = []
+        items = iter(())
 
         # the following can be slow and could be deferred to lazy entries, if we can get
         # the names without details cheaply
         if isinstance(self._stac, pystac.Catalog):
             items = itertools.chain(self._stac.get_children(), self._stac.get_items())
         elif isinstance(self._stac, pystac.ItemCollection):
-            items = self._stac.items
+            items = iter(self._stac)
         if hasattr(self._stac, "assets"):
             for key, value in self._stac.assets.items():
                 if signer:
@@ -163,11 +173,12 @@ class StacCatalogReader(BaseReader):
                 except (ValueError, TypeError, StopIteration):
                     pass
 
+        qname = self.qname()
         for subcatalog in items:
             subcls = type(subcatalog).__name__
 
             cat[subcatalog.id] = ReaderDescription(
-                reader=self.qname(),
+                reader=qname,
                 kwargs=dict(
                     {
                         "cls": subcls,
@@ -262,22 +273,22 @@ class StackBands(BaseReader):
         hrefs = []
         types = []
         assets = self._stac.assets
+        # lookups from common_name/name (and id) to band info; first band listed wins
+        by_name = {}
+        by_name_or_id = {}
+        for b in band_info:
+            for field in ["common_name", "name", "id"]:
+                value = b.get(field)
+                if value is not None:
+                    by_name_or_id.setdefault(value, b)
+                    if field != "id":
+                        by_name.setdefault(value, b)
         for band in bands:
             # band can be band id, name or common_name
             if band in assets:
-                info = next(
-                    (
-                        b
-                        for b in band_info
-                        if band in [b.get(_) for _ in ["common_name", "name", "id"]]
-                    ),
-                    None,
-                )
+                info = by_name_or_id.get(band)
             else:
-                info = next(
-                    (b for b in band_info if band in [b.get(_) for _ in ["common_name", "name"]]),
-                    None,
-                )
+                info = by_name.get(band)
                 if info is not None:
                     band = info.get("id", info.get("name"))
 
@@ -331,21 +342,32 @@ class StacSearch(BaseReader):
             passed to the resulting readers, e.g., for auth information
         """
         import requests
-        from pystac import ItemCollection
+        from pystac import Item, ItemCollection
 
-        req = requests.post(data.url + "/search", json=query)
-        out = req.json()
         cat = Catalog(metadata=self.metadata)
-        items = ItemCollection.from_dict(out).items
-        for subcatalog in items:
-            subcls = type(subcatalog).__name__
-            cat[subcatalog.id] = ReaderDescription(
-                reader=StacCatalogReader.qname(),
-                kwargs=dict(
-                    **{"cls": subcls, "data": datatypes.Literal(subcatalog.to_dict())},
-                    **kwargs,
-                ),
-            )
+        qname = StacCatalogReader.qname()
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+        with requests.post(data.url + "/search", json=query, stream=ijson is not None) as r:
+            r.raise_for_status()
+            if ijson is not None:
+                # parse features one at a time from the response stream
+                r.raw.decode_content = True
+                features = ijson.items(r.raw, "features.item", use_float=True)
+                items = (Item.from_dict(feature) for feature in features)
+            else:
+                items = ItemCollection.from_dict(r.json()).items
+            for subcatalog in items:
+                subcls = type(subcatalog).__name__
+                cat[subcatalog.id] = ReaderDescription(
+                    reader=qname,
+                    kwargs=dict(
+                        **{"cls": subcls, "data": datatypes.Literal(subcatalog.to_dict())},
+                        **kwargs,
+                    ),
+                )
         return cat
 
 
@@ -475,14 +497,15 @@ class HuggingfaceHubCatalog(BaseReader):
         from intake.readers.readers import HuggingfaceReader
         import huggingface_hub
 
-        datasets = huggingface_hub.list_datasets(full=False)
-        if not with_community_datasets:
-            datasets = [dataset for dataset in datasets if "/" not in dataset.id]
-        entries = [
-            HuggingfaceReader(data=HuggingfaceDataset(d.id, metadata=d.__dict__)) for d in datasets
-        ]
+        names = []
+        entries = []
+        for d in huggingface_hub.list_datasets(full=False):
+            if not with_community_datasets and "/" in d.id:
+                continue
+            names.append(d.id)
+            entries.append(HuggingfaceReader(data=HuggingfaceDataset(d.id, metadata=vars(d))))
         cat = Catalog(entries=entries)
-        cat.aliases = {d.id: e for d, e in zip(datasets, cat.entries)}
+        cat.aliases = dict(zip(names, cat.entries))
         return cat
 
 
@@ -521,13 +544,17 @@ class SKLearnExamplesCatalog(BaseReader):
         from intake.readers.readers import SKLearnExampleReader
         import sklearn.datasets
 
-        names = [funcname[5:] for funcname in dir(sklearn.datasets) if funcname.startswith("load_")]
-        names.extend(
-            [funcname[6:] for funcname in dir(sklearn.datasets) if funcname.startswith("fetch_")]
-        )
+        funcnames = getattr(sklearn.datasets, "__all__", None) or dir(sklearn.datasets)
+        loads, fetches = [], []
+        for funcname in funcnames:
+            if funcname.startswith("load_"):
+                loads.append(funcname[5:])
+            elif funcname.startswith("fetch_"):
+                fetches.append(funcname[6:])
+        names = loads + fetches
         entries = [SKLearnExampleReader(name=name) for name in names]
         cat = Catalog(entries=entries)
-        cat.aliases = {name: e for name, e in zip(names, cat.entries)}
+        cat.aliases = dict(zip(names, cat.entries))
         return cat
 
 
@@ -568,14 +595,10 @@ class TorchDatasetsCatalog(BaseReader):
         cat = Catalog()
         for name in ("vision", "audio", "text"):
             try:
-                mod = importlib.import_module(f"torch{name}")
-                for func in mod.datasets.__all__:
-                    f = getattr(mod.datasets, func)
-                    metadata = (
-                        {"description": f.__doc__.split("\n", 1)[0], "text": f.__doc__}
-                        if f.__doc__
-                        else {}
-                    )
+                datasets = importlib.import_module(f"torch{name}").datasets
+                for func in datasets.__all__:
+                    doc = getattr(datasets, func).__doc__
+                    metadata = {"description": doc.split("\n", 1)[0], "text": doc} if doc else {}
                     metadata["section"] = name
                     cat[func] = TorchDataset(
                         modname=name, funcname=func, rootdir=rootdir, metadata=metadata
@@ -26,6 +26,9 @@ class ImportsProperty:
         return cls.imports
 
 
+_converter_generation = 0  # bumped whenever a converter class is defined
+
+
 class BaseConverter(BaseReader):
     """Converts from one object type to another
 
@@ -38,6 +41,11 @@ class BaseConverter(BaseReader):
 
     instances: dict[str, str] = {}  #: mapping from input types to output types
 
+    def __init_subclass__(cls, **kwargs):
+        global _converter_generation
+        super().__init_subclass__(**kwargs)
+        _converter_generation += 1
+
     def run(self, x, *args, **kwargs):
         """Execute a conversion stage on the output object from another stage
 
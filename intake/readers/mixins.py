@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from itertools import chain
 
 from intake import import_name
@@ -14,8 +15,9 @@ class PipelineMixin(Completable):
     def __getattr__(self, item):
         super().tab_completion_fixer(item)
         try:
-            if item in dir(self.transform):
-                return getattr(self.transform, item)
+            transform = self.transform
+            if item in transform._name_set:
+                return getattr(transform, item)
             if "Catalog" in self.output_instance:
                 # a better way to mark this condition, perhaps the datatype's structure?
                 out = self.read()[item]
@@ -23,7 +25,7 @@ class PipelineMixin(Completable):
                 out = self._namespaces[item]
             # the following can go very wrong - only allow via explicit opt-in?
             else:
-                out = self.transform.__getattr__(item)  # arbitrary method call
+                out = transform.__getattr__(item)  # arbitrary method call
         except RecursionError as e:
             raise AttributeError(item) from e
         else:
@@ -57,6 +59,12 @@ class PipelineMixin(Completable):
 
         return get_namespaces(self)
 
+    def __getstate__(self):
+        # the cached Functioner refers back to this instance; do not persist or copy it
+        state = self.__dict__.copy()
+        state.pop("_transform_cache", None)
+        return state
+
     @classmethod
     def output_doc(cls):
         """Doc associated with output type"""
@@ -80,10 +88,15 @@ class PipelineMixin(Completable):
 
     @property
     def transform(self):
-        from intake.readers.convert import convert_classes
+        from intake.readers import convert
 
-        funcdict = convert_classes(self.output_instance)
-        return Functioner(self, funcdict)
+        # rebuild if output_instance changed or new converters were defined since caching
+        key = (self.output_instance, convert._converter_generation)
+        hit = self.__dict__.get("_transform_cache")
+        if hit is None or hit[0] != key:
+            hit = key, Functioner(self, convert.convert_classes(self.output_instance))
+            self.__dict__["_transform_cache"] = hit
+        return hit[1]
 
 
 class Functioner(Completable):
@@ -92,6 +105,9 @@ class Functioner(Completable):
     def __init__(self, reader, funcdict):
         self.reader = reader
         self.funcdict = funcdict
+        self._by_name = {}
+        for outtype, func in funcdict.items():
+            self._by_name.setdefault(func.__name__, (outtype, func))
 
     def _ipython_key_completions_(self):
         return list(self.funcdict)
@@ -145,23 +161,25 @@ class Functioner(Completable):
             dnames = []
         return dnames
 
+    @cached_property
+    def _name_set(self):
+        return set(chain((f.__name__ for f in self.funcdict.values()), self.methods()))
+
     def __dir__(self):
-        return list(
-            sorted(set(chain((f.__name__ for f in self.funcdict.values()), self.methods())))
-        )
+        return sorted(self._name_set)
 
     def __getattr__(self, item):
         super().tab_completion_fixer(item)
         from intake.readers.convert import Pipeline
         from intake.readers.transform import Method
 
-        out = [(outtype, func) for outtype, func in self.funcdict.items() if func.__name__ == item]
-        if not len(out):
+        hit = self._by_name.get(item)
+        if hit is None:
             outtype = self.reader.output_instance
             func = Method
             kw = {"method_name": item}
         else:
-            outtype, func = out[0]
+            outtype, func = hit
             kw = {}
         try:
             if isinstance(self.reader, Pipeline):
@@ -1,7 +1,11 @@
+import io
+import json
 import os
+import sys
 
 import pytest
 
+import intake.readers.catalogs
 import intake.readers.datatypes
 
 here = os.path.dirname(os.path.abspath(__file__))
@@ -25,3 +29,50 @@ def test_bands():
     reader = data.to_reader_cls(reader="Bands")(data, list_of_bands).read()
     assert isinstance(reader.kwargs["data"], intake.readers.datatypes.TIFF)
     assert len(reader.kwargs["data"].url) == 2
+
+
+class FakeResponse:
+    def __init__(self, body: dict, status_code: int = 200):
+        self.raw = io.BytesIO(json.dumps(body).encode())
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+    def raise_for_status(self):
+        import requests
+
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def json(self):
+        return json.loads(self.raw.getvalue())
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_search(monkeypatch, streaming):
+    import requests
+
+    if streaming:
+        pytest.importorskip("ijson")
+    else:
+        # import of ijson fails, so the whole response is parsed at once
+        monkeypatch.setitem(sys.modules, "ijson", None)
+    with open(simple_item_url) as f:
+        item = json.load(f)
+    features = [dict(item, id="one"), dict(item, id="two")]
+    body = {"type": "FeatureCollection", "features": features}
+    monkeypatch.setattr(requests, "post", lambda *_, **__: FakeResponse(body))
+
+    data = intake.readers.datatypes.STACJSON("http://stac.test")
+    cat = intake.readers.catalogs.StacSearch(data=data, query={}).read()
+    assert set(cat.aliases) == {"one", "two"}
+    assert cat["one"].kwargs["data"].data["id"] == "one"
+
+    body = {"code": "BadRequest", "description": "not a search result"}
+    monkeypatch.setattr(requests, "post", lambda *_, **__: FakeResponse(body, 400))
+    with pytest.raises(requests.HTTPError):
+        intake.readers.catalogs.StacSearch(data=data, query={}).read()
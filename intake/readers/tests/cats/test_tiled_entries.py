@@ -0,0 +1,33 @@
+from intake.readers.catalogs import TiledLazyEntries
+
+
+class FakeClient(dict):
+    """Stands in for a Tiled node, counting how often it is listed"""
+
+    listings = 0
+
+    def __iter__(self):
+        self.listings += 1
+        return super().__iter__()
+
+
+def test_keys_given():
+    client = FakeClient(a=1, b=2)
+    entries = TiledLazyEntries(client, keys=["a", "b"])
+    assert list(entries) == ["a", "b"]
+    assert len(entries) == 2
+    assert client.listings == 0
+
+    entries = TiledLazyEntries(client)
+    assert list(entries) == ["a", "b"]
+    assert len(entries) == 2
+    assert client.listings == 1
+
+
+def test_repr_truncated():
+    client = FakeClient({f"k{i:02}": i for i in range(25)})
+    text = repr(TiledLazyEntries(client))
+    assert text == f"TiledEntries {[f'k{i:02}' for i in range(20)]}..."
+
+    client = FakeClient(b=1, a=2)
+    assert repr(TiledLazyEntries(client)) == "TiledEntries ['a', 'b']"
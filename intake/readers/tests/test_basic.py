@@ -34,3 +34,23 @@ def test_recommend_reader():
     )
     pp = datatypes.CSV("")
     assert readers.PandasCSV in readers.recommend(pp)["importable"]
+
+
+def test_transform_cache():
+    import copy
+    import pickle
+
+    from intake.readers.convert import convert_classes
+
+    reader = readers.PandasCSV(datatypes.CSV(url=f"{testdir}/entry1_1.csv"))
+    transform = reader.transform
+    assert reader.transform is transform
+    assert "transform" in dir(reader)
+
+    for other in (pickle.loads(pickle.dumps(reader)), copy.copy(reader)):
+        assert other.transform is not transform
+        assert other.transform.reader is other
+
+    reader.output_instance = "numpy:ndarray"
+    assert reader.transform is not transform
+    assert reader.transform.funcdict == convert_classes("numpy:ndarray")
@@ -72,28 +72,40 @@ def represent_dictionary_order(self, dict_data):
     return self.represent_mapping("tag:yaml.org,2002:map", dict_data.items())
 
 
+# libyaml-backed loader and dumper, if pyyaml was built with them
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
 yaml.add_representer(OrderedDict, represent_dictionary_order)
+yaml.add_representer(OrderedDict, represent_dictionary_order, Dumper=Dumper)
 
 
 @contextmanager
 def no_duplicate_yaml():
-    yaml.SafeLoader.add_constructor(
-        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, no_duplicates_constructor
-    )
-    yaml.SafeLoader.add_constructor("tag:yaml.org,2002:python/tuple", tuple_constructor)
+    loaders = {yaml.SafeLoader, SafeLoader}
+    for loader in loaders:
+        loader.add_constructor(
+            yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, no_duplicates_constructor
+        )
+        loader.add_constructor("tag:yaml.org,2002:python/tuple", tuple_constructor)
     try:
         yield
     finally:
-        yaml.SafeLoader.add_constructor(
-            yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-            yaml.constructor.SafeConstructor.construct_yaml_map,
-        )
+        for loader in loaders:
+            loader.add_constructor(
+                yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
+                yaml.constructor.SafeConstructor.construct_yaml_map,
+            )
 
 
 def yaml_load(stream):
-    """Parse YAML in a context where duplicate keys raise exception"""
+    """Parse YAML in a context where duplicate keys raise exception
+
+    ``stream`` may be text or an open file; files are passed straight to the
+    parser, so they are read incrementally rather than loaded into memory first.
+    """
     with no_duplicate_yaml():
-        return yaml.safe_load(stream)
+        return yaml.load(stream, Loader=SafeLoader)
 
 
 def classname(ob):